@@ -11,16 +11,44 @@ Tests the Python CLI interface to ensure:
 
 import sys
 import os
+import io
 import json
+import ctypes
+import select
+import struct
+import time
+import uuid
+import socket
 import subprocess
-import tempfile
-import shutil
+import threading
+import contextlib
+import dataclasses
+import functools
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 
+# Use orjson for parsing container configs when available
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# Paths used by every test
+MINIRUN = str(PROJECT_ROOT / "minirun")
+CONTAINERS_DIR = PROJECT_ROOT / "containers"
+
+# Launch commands with os.posix_spawnp instead of subprocess where supported
+USE_POSIX_SPAWN = hasattr(os, "posix_spawnp")
+
+# Fields every container config must have
+REQUIRED_CONFIG_FIELDS = ("name", "rootfs", "command")
+
 # Colors for output
 GREEN = '\033[0;32m'
 RED = '\033[0;31m'
@@ -28,55 +56,429 @@ YELLOW = '\033[1;33m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'
 
+# Message prefixes, built once instead of per print
+_PASS_PREFIX = f"{GREEN}✓ PASS: "
+_FAIL_PREFIX = f"{RED}✗ FAIL: "
+_INFO_PREFIX = f"{BLUE}ℹ INFO: "
+_SUFFIX = NC
+
 # Test statistics
-tests_passed = 0
-tests_failed = 0
-failed_tests = []
+@dataclasses.dataclass
+class Stats:
+    passed: int = 0
+    failed: int = 0
+    failures: list = dataclasses.field(default_factory=list)
+
+STATS = Stats()
+STATS_LOCK = threading.Lock()
+
+# Long-lived `minirun serve-test` daemon, set up in main()
+DAEMON_SOCKET = f"/tmp/minirun-test-{uuid.uuid4().hex}.sock"
+_FRAME_HEADER = struct.Struct(">I")
+# Seconds to wait for a daemon reply before failing the test
+DAEMON_TIMEOUT = 30
+pipeline = None
+
+# Open fd on the containers directory, set up in main() so unlinks skip the path walk
+containers_dirfd = None
+
+# Per-thread output buffer so concurrent tests don't interleave their prints
+_output = threading.local()
+
+def emit(*parts):
+    """Print to the current test's buffer (or stdout outside a test)"""
+    print(*parts, sep="", file=getattr(_output, 'buffer', sys.stdout))
+
+def unique_name(prefix):
+    """Generate a container name that can't collide with parallel tests"""
+    return f"{prefix}-{uuid.uuid4().hex}"
 
 def print_success(message):
     """Print success message"""
-    global tests_passed
-    tests_passed += 1
-    print(f"{GREEN}✓ PASS: {message}{NC}")
+    with STATS_LOCK:
+        STATS.passed += 1
+    emit(_PASS_PREFIX, message, _SUFFIX)
 
 def print_error(message):
     """Print error message"""
-    global tests_failed
-    tests_failed += 1
-    failed_tests.append(message)
-    print(f"{RED}✗ FAIL: {message}{NC}")
+    with STATS_LOCK:
+        STATS.failed += 1
+        STATS.failures.append(message)
+    emit(_FAIL_PREFIX, message, _SUFFIX)
 
 def print_info(message):
     """Print info message"""
-    print(f"{BLUE}ℹ INFO: {message}{NC}")
+    emit(_INFO_PREFIX, message, _SUFFIX)
+
+def run_command(argv, check=False, direct=False):
+    """Run a command (argv list, no shell) and return output as bytes
+
+    Pass direct=True to always run a real process, e.g. to cover the CLI
+    entry point and its exit codes rather than the test daemon.
+    """
+    # Route minirun commands through the test daemon to skip interpreter startup
+    if not direct and _use_daemon(argv):
+        try:
+            return pipeline.result(pipeline.submit(argv[1:]), argv[1:])
+        except DaemonUnavailable:
+            pass
+    if check:
+        return _run_checked(argv)
+    return _run_unchecked(argv)
 
-def run_command(cmd, check=True):
-    """Run a command and return output"""
+def _run_checked(argv):
+    """Run a command with check=True, returning output even when it fails"""
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            check=check
-        )
+        result = subprocess.run(argv, capture_output=True, check=True)
         return result.returncode, result.stdout, result.stderr
     except subprocess.CalledProcessError as e:
         return e.returncode, e.stdout, e.stderr
 
+def _run_unchecked(argv):
+    """Run a command without check, so no exception handling is needed"""
+    if USE_POSIX_SPAWN:
+        return _spawn(argv)
+    result = subprocess.run(argv, capture_output=True)
+    return result.returncode, result.stdout, result.stderr
+
+def _spawn(argv):
+    """Run a command via os.posix_spawnp, skipping subprocess's Popen machinery"""
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        # os.pipe() fds are close-on-exec, so only the dup2'd copies reach the child
+        pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, out_w, 1),
+            (os.POSIX_SPAWN_DUP2, err_w, 2),
+        ])
+    except OSError:
+        os.close(out_r)
+        os.close(err_r)
+        raise
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+    stdout, stderr = _drain(out_r, err_r)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), stdout, stderr
+
+def _drain(out_fd, err_fd):
+    """Read both pipes to EOF together so neither can fill up and block the child"""
+    chunks = {out_fd: [], err_fd: []}
+    open_fds = [out_fd, err_fd]
+    while open_fds:
+        ready, _, _ = select.select(open_fds, [], [])
+        for fd in ready:
+            data = os.read(fd, 65536)
+            if data:
+                chunks[fd].append(data)
+            else:
+                open_fds.remove(fd)
+                os.close(fd)
+    return b"".join(chunks[out_fd]), b"".join(chunks[err_fd])
+
+def _snapshot_containers():
+    """Return the set of file names in the containers directory (one scandir, no per-file stat)"""
+    with os.scandir(CONTAINERS_DIR) as entries:
+        return {entry.name for entry in entries}
+
+class DaemonUnavailable(ConnectionError):
+    """The test daemon can't answer a request; callers rerun it directly"""
+
+class Pipeline:
+    """Persistent connection to the test daemon that pipelines requests
+
+    Requests and responses are length-prefixed JSON frames tagged with a
+    sequence id, so any number of threads can submit on the one socket and
+    a reader thread hands each response to the matching future.
+    """
+
+    def __init__(self, socket_path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(socket_path)
+        self.ids = itertools.count()
+        self.pending = {}
+        self.error = None
+        self.pending_lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.reader = threading.Thread(target=self._read_responses, daemon=True)
+        self.reader.start()
+
+    def submit(self, args):
+        """Send a command line to the daemon, returning a Future for its output"""
+        future = Future()
+        with self.send_lock:
+            request_id = next(self.ids)
+            with self.pending_lock:
+                # The reader has stopped, so nothing would ever resolve this
+                if self.error is not None:
+                    raise DaemonUnavailable(str(self.error))
+                self.pending[request_id] = (future, args)
+            payload = json.dumps({"id": request_id, "argv": args}).encode()
+            self.sock.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+        return future
+
+    def _read_responses(self):
+        """Resolve pending futures as responses arrive"""
+        error = ConnectionError("minirun test daemon closed the connection")
+        try:
+            with self.sock.makefile('rb') as reader:
+                while True:
+                    header = reader.read(_FRAME_HEADER.size)
+                    if len(header) < _FRAME_HEADER.size:
+                        break
+                    (length,) = _FRAME_HEADER.unpack(header)
+                    response = json.loads(reader.read(length))
+                    with self.pending_lock:
+                        future, _ = self.pending.pop(response["id"], (None, None))
+                    if future is None:
+                        # Can't tell which request this answers; fail them all
+                        # rather than leave one waiting forever
+                        error = ConnectionError(
+                            f"minirun test daemon sent a reply for unknown request "
+                            f"{response['id']!r}: {response['stderr']}"
+                        )
+                        break
+                    future.set_result((
+                        response["returncode"],
+                        response["stdout"].encode(),
+                        response["stderr"].encode(),
+                    ))
+        except Exception as e:
+            error = ConnectionError(f"minirun test daemon connection failed: {e}")
+        finally:
+            self.fail(error)
+
+    def fail(self, error, culprit_id=None):
+        """Stop using the pipeline and fail every request still waiting on it
+
+        The request `culprit_id` gets `error` itself; the rest get
+        DaemonUnavailable so their callers rerun them directly.
+        """
+        with self.pending_lock:
+            if self.error is None:
+                self.error = error
+            orphaned = list(self.pending.items())
+            self.pending.clear()
+        # Hang up so the daemon drops requests still queued on this
+        # connection instead of running them after they were rerun directly
+        with contextlib.suppress(OSError):
+            self.sock.shutdown(socket.SHUT_RDWR)
+        for request_id, (future, _) in orphaned:
+            if request_id == culprit_id:
+                future.set_exception(error)
+            else:
+                future.set_exception(DaemonUnavailable(str(self.error)))
+
+    def result(self, future, args):
+        """Wait for a submitted request, giving up after DAEMON_TIMEOUT seconds"""
+        try:
+            return future.result(timeout=DAEMON_TIMEOUT)
+        except FutureTimeoutError:
+            pass
+        # Requests run one at a time and in order, so the oldest pending one
+        # is what the daemon is stuck on; everything else is just queued
+        # behind it. Blame that one and fail the rest so they rerun directly.
+        culprit_id = error = None
+        with self.pending_lock:
+            if self.error is None and self.pending:
+                culprit_id = min(self.pending)
+                error = TimeoutError(
+                    f"minirun test daemon did not answer {self.pending[culprit_id][1]} "
+                    f"within {DAEMON_TIMEOUT}s"
+                )
+        if error is not None:
+            self.fail(error, culprit_id)
+        # Resolved by now: a reply, the TimeoutError, or DaemonUnavailable
+        return future.result()
+
+    def close(self, timeout=5):
+        """Stop sending and wait (bounded) for the reader to finish"""
+        with contextlib.suppress(OSError):
+            self.sock.shutdown(socket.SHUT_WR)
+        self.reader.join(timeout)
+        self.sock.close()
+
+def run_pipelined(argvs):
+    """Submit several minirun commands up front, then collect (returncode, stdout, stderr) for each"""
+    if not all(_use_daemon(argv) for argv in argvs):
+        return [run_command(argv, check=False) for argv in argvs]
+    try:
+        futures = [pipeline.submit(argv[1:]) for argv in argvs]
+    except DaemonUnavailable:
+        return [run_command(argv, check=False, direct=True) for argv in argvs]
+    results = []
+    for future, argv in zip(futures, argvs):
+        try:
+            results.append(pipeline.result(future, argv[1:]))
+        except DaemonUnavailable:
+            results.append(run_command(argv, check=False, direct=True))
+    return results
+
+def _use_daemon(argv):
+    """Whether argv can go through the test daemon"""
+    # start still needs a real process for the C runtime, and a daemon that
+    # has failed (e.g. timed out) is bypassed for the rest of the run
+    return (
+        pipeline is not None
+        and pipeline.error is None
+        and argv[0] == MINIRUN
+        and argv[1:2] != ["start"]
+    )
+
+def start_daemon():
+    """Start the minirun test daemon and connect to it"""
+    global pipeline
+    proc = subprocess.Popen(
+        [MINIRUN, "serve-test", "--socket", DAEMON_SOCKET],
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    # The daemon prints a line once it is listening
+    if proc.stdout.readline().strip() == "ready":
+        pipeline = Pipeline(DAEMON_SOCKET)
+    else:
+        print_info("minirun test daemon failed to start, running commands directly")
+    return proc
+
+def stop_daemon(proc):
+    """Shut down the minirun test daemon"""
+    global pipeline
+    # Stop the daemon first: if it is stuck on a request, the pipeline's
+    # reader would otherwise wait on it forever
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    proc.stdout.close()
+    if pipeline is not None:
+        pipeline.close()
+        pipeline = None
+
+# inotify constants from <sys/inotify.h>
+IN_CREATE = 0x00000100
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+class ContainersWatch:
+    """Watch the containers directory for new config files via inotify
+
+    minirun writes configs with an atomic rename, which shows up as
+    IN_MOVED_TO rather than IN_CREATE, so both are watched. Falls back to
+    a directory snapshot where inotify isn't available.
+    """
+
+    def __init__(self):
+        self.fd = None
+        self.seen = set()
+
+    def __enter__(self):
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                return self
+            if libc.inotify_add_watch(fd, str(CONTAINERS_DIR).encode(), IN_CREATE | IN_MOVED_TO) < 0:
+                os.close(fd)
+                return self
+            self.fd = fd
+        except (OSError, AttributeError):
+            pass
+        return self
+
+    def __exit__(self, *exc):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def wait_for(self, name, timeout=2.0):
+        """Return True once `name` appears in the containers directory, within `timeout` seconds"""
+        if self.fd is None:
+            return name in _snapshot_containers()
+        # Events from other tests keep arriving, so bound the whole wait
+        deadline = time.monotonic() + timeout
+        while name not in self.seen:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return False
+            data = os.read(self.fd, 4096)
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT.size
+                self.seen.add(data[offset:offset + length].rstrip(b"\0").decode())
+                offset += length
+        return True
+
+@functools.lru_cache(maxsize=128)
+def _read_config(path_str, mtime_ns):
+    """Parse a container config; mtime_ns is part of the cache key so edits invalidate it"""
+    return _json.loads(Path(path_str).read_bytes())
+
+def load_config(config_file):
+    """Return the parsed config, reusing the cached parse while the file is unchanged"""
+    if containers_dirfd is not None and config_file.parent == CONTAINERS_DIR:
+        st = os.stat(config_file.name, dir_fd=containers_dirfd)
+    else:
+        st = os.stat(config_file)
+    return _read_config(str(config_file), st.st_mtime_ns)
+
+def _fast_cleanup(name):
+    """Remove a test container's config directly, skipping a minirun delete
+
+    Only test_container_delete needs to go through the real command.
+    """
+    if containers_dirfd is None:
+        (CONTAINERS_DIR / f"{name}.json").unlink(missing_ok=True)
+        return
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(f"{name}.json", dir_fd=containers_dirfd)
+
+@contextlib.contextmanager
+def container(name):
+    """Create a container for the duration of a with-block, yielding its config path"""
+    returncode, stdout, stderr = run_command(
+        [MINIRUN, "create", name],
+        check=False
+    )
+    if returncode != 0:
+        raise RuntimeError(f"Container creation failed: {(stdout + stderr).decode(errors='replace')}")
+    try:
+        yield CONTAINERS_DIR / f"{name}.json"
+    finally:
+        _fast_cleanup(name)
+
+def run_batch(commands):
+    """Run several minirun commands in one process, returning (returncode, stdout bytes) per command"""
+    script = "".join(json.dumps(command) + "\n" for command in commands).encode()
+    result = subprocess.run(
+        [MINIRUN, "batch", "-"],
+        input=script,
+        capture_output=True
+    )
+    results = [json.loads(line) for line in result.stdout.splitlines()]
+    if len(results) != len(commands):
+        raise RuntimeError(f"batch returned {len(results)} results for {len(commands)} commands: {result.stderr.decode(errors='replace')}")
+    return [(r["returncode"], r["stdout"].encode()) for r in results]
+
 def test_cli_exists():
     """Test 1: Verify CLI script exists and is executable"""
-    print("\n[Test 1: CLI Exists]")
-    
-    cli_path = PROJECT_ROOT / "minirun"
+    emit("\n[Test 1: CLI Exists]")
     
-    if cli_path.exists():
+    if os.path.exists(MINIRUN):
         print_success("minirun CLI file exists")
     else:
         print_error("minirun CLI file not found")
         return False
     
-    if os.access(cli_path, os.X_OK):
+    if os.access(MINIRUN, os.X_OK):
         print_success("minirun CLI is executable")
     else:
         print_error("minirun CLI is not executable")
@@ -86,9 +488,10 @@ def test_cli_exists():
 
 def test_cli_help():
     """Test 2: Verify help command works"""
-    print("\n[Test 2: Help Command]")
+    emit("\n[Test 2: Help Command]")
     
-    returncode, stdout, stderr = run_command(f"{PROJECT_ROOT}/minirun --help", check=False)
+    # Run as a real process so the CLI entry point itself stays covered
+    returncode, stdout, stderr = run_command([MINIRUN, "--help"], check=True, direct=True)
     
     if returncode == 0:
         print_success("Help command executed successfully")
@@ -96,7 +499,7 @@ def test_cli_help():
         print_error(f"Help command failed with code {returncode}")
         return False
     
-    if "usage" in stdout.lower() or "minirun" in stdout.lower():
+    if b"usage" in stdout.lower() or b"minirun" in stdout.lower():
         print_success("Help output contains usage information")
     else:
         print_error("Help output missing usage information")
@@ -106,150 +509,130 @@ def test_cli_help():
 
 def test_container_create():
     """Test 3: Test container creation"""
-    print("\n[Test 3: Container Creation]")
+    emit("\n[Test 3: Container Creation]")
     
-    test_name = f"test-create-{os.getpid()}"
+    test_name = unique_name("test-create")
     
-    # Create container
-    returncode, stdout, stderr = run_command(
-        f"{PROJECT_ROOT}/minirun create {test_name}",
-        check=False
-    )
-    
-    if returncode == 0:
+    # Start watching before the create so its event can't be missed
+    with ContainersWatch() as watch, container(test_name) as config_file:
         print_success(f"Container '{test_name}' created successfully")
-    else:
-        print_error(f"Container creation failed: {stderr}")
-        return False
-    
-    # Verify container config file exists
-    config_file = PROJECT_ROOT / "containers" / f"{test_name}.json"
-    if config_file.exists():
-        print_success("Container config file created")
-    else:
-        print_error("Container config file not found")
-        return False
-    
-    # Verify config file is valid JSON
-    try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        print_success("Container config is valid JSON")
         
-        # Check required fields
-        if config.get('name') == test_name:
-            print_success("Container config has correct name")
+        # Verify container config file exists
+        if watch.wait_for(config_file.name):
+            print_success("Container config file created")
         else:
-            print_error("Container config has incorrect name")
+            print_error("Container config file not found")
+            return False
         
-        if 'rootfs' in config and 'command' in config:
-            print_success("Container config has required fields")
-        else:
-            print_error("Container config missing required fields")
-    except json.JSONDecodeError:
-        print_error("Container config is not valid JSON")
-        return False
-    
-    # Cleanup
-    run_command(f"{PROJECT_ROOT}/minirun delete {test_name}", check=False)
+        # Verify config file is valid JSON
+        try:
+            config = load_config(config_file)
+            print_success("Container config is valid JSON")
+            
+            # Check required fields
+            if config.get('name') == test_name:
+                print_success("Container config has correct name")
+            else:
+                print_error("Container config has incorrect name")
+            
+            missing = [field for field in REQUIRED_CONFIG_FIELDS if field not in config]
+            if not missing:
+                print_success("Container config has required fields")
+            else:
+                print_error(f"Container config missing required fields: {', '.join(missing)}")
+        except _json.JSONDecodeError:
+            print_error("Container config is not valid JSON")
+            return False
     
     return True
 
 def test_container_list():
     """Test 4: Test container listing"""
-    print("\n[Test 4: Container Listing]")
+    emit("\n[Test 4: Container Listing]")
     
-    # Create test containers
-    test_name1 = f"test-list-1-{os.getpid()}"
-    test_name2 = f"test-list-2-{os.getpid()}"
+    test_name1 = unique_name("test-list-1")
+    test_name2 = unique_name("test-list-2")
     
-    run_command(f"{PROJECT_ROOT}/minirun create {test_name1}", check=False)
-    run_command(f"{PROJECT_ROOT}/minirun create {test_name2}", check=False)
-    
-    # List containers
-    returncode, stdout, stderr = run_command(
-        f"{PROJECT_ROOT}/minirun list",
-        check=False
-    )
+    # Create and list in a single minirun invocation
+    try:
+        results = run_batch([
+            {"op": "create", "name": test_name1},
+            {"op": "create", "name": test_name2},
+            {"op": "list"},
+        ])
+    finally:
+        # Cleanup
+        _fast_cleanup(test_name1)
+        _fast_cleanup(test_name2)
+    returncode, stdout = results[2]
     
     if returncode == 0:
         print_success("List command executed successfully")
     else:
-        print_error(f"List command failed: {stderr}")
+        print_error(f"List command failed: {stdout.decode(errors='replace')}")
         return False
     
-    if test_name1 in stdout and test_name2 in stdout:
+    if test_name1.encode() in stdout and test_name2.encode() in stdout:
         print_success("List command shows created containers")
     else:
         print_error("List command doesn't show all containers")
     
-    # Cleanup
-    run_command(f"{PROJECT_ROOT}/minirun delete {test_name1}", check=False)
-    run_command(f"{PROJECT_ROOT}/minirun delete {test_name2}", check=False)
-    
     return True
 
 def test_container_info():
     """Test 5: Test container info"""
-    print("\n[Test 5: Container Info]")
+    emit("\n[Test 5: Container Info]")
     
-    test_name = f"test-info-{os.getpid()}"
+    test_name = unique_name("test-info")
     
-    # Create container
-    run_command(f"{PROJECT_ROOT}/minirun create {test_name}", check=False)
-    
-    # Get info
-    returncode, stdout, stderr = run_command(
-        f"{PROJECT_ROOT}/minirun info {test_name}",
-        check=False
-    )
+    with container(test_name):
+        returncode, stdout, stderr = run_command(
+            [MINIRUN, "info", test_name],
+            check=False
+        )
     
     if returncode == 0:
         print_success("Info command executed successfully")
     else:
-        print_error(f"Info command failed: {stderr}")
-        run_command(f"{PROJECT_ROOT}/minirun delete {test_name}", check=False)
+        print_error(f"Info command failed: {stderr.decode(errors='replace')}")
         return False
     
-    if test_name in stdout:
+    if test_name.encode() in stdout:
         print_success("Info output contains container name")
     else:
         print_error("Info output missing container name")
     
-    # Cleanup
-    run_command(f"{PROJECT_ROOT}/minirun delete {test_name}", check=False)
-    
     return True
 
 def test_container_delete():
     """Test 6: Test container deletion"""
-    print("\n[Test 6: Container Deletion]")
+    emit("\n[Test 6: Container Deletion]")
     
-    test_name = f"test-delete-{os.getpid()}"
+    test_name = unique_name("test-delete")
     
     # Create container
-    run_command(f"{PROJECT_ROOT}/minirun create {test_name}", check=False)
+    returncode, stdout, stderr = run_command([MINIRUN, "create", test_name], check=False)
     
-    # Verify it exists
-    config_file = PROJECT_ROOT / "containers" / f"{test_name}.json"
-    if not config_file.exists():
+    # Verify it was created
+    config_file = CONTAINERS_DIR / f"{test_name}.json"
+    if returncode != 0:
         print_error("Container was not created properly")
         return False
     
     # Delete container
     returncode, stdout, stderr = run_command(
-        f"{PROJECT_ROOT}/minirun delete {test_name}",
+        [MINIRUN, "delete", test_name],
         check=False
     )
     
     if returncode == 0:
         print_success("Delete command executed successfully")
     else:
-        print_error(f"Delete command failed: {stderr}")
+        print_error(f"Delete command failed: {stderr.decode(errors='replace')}")
         return False
     
     # Verify it's gone
-    if not config_file.exists():
+    if config_file.name not in _snapshot_containers():
         print_success("Container config file removed")
     else:
         print_error("Container config file still exists")
@@ -259,11 +642,13 @@ def test_container_delete():
 
 def test_error_handling():
     """Test 7: Test error handling for invalid operations"""
-    print("\n[Test 7: Error Handling]")
+    emit("\n[Test 7: Error Handling]")
     
+    missing_name = unique_name("nonexistent")
+
     # Try to start non-existent container
     returncode, stdout, stderr = run_command(
-        f"{PROJECT_ROOT}/minirun start nonexistent-{os.getpid()}",
+        [MINIRUN, "start", missing_name],
         check=False
     )
     
@@ -272,10 +657,12 @@ def test_error_handling():
     else:
         print_error("Non-existent container start should fail")
     
-    # Try to delete non-existent container
+    # Try to delete non-existent container; run as a real process so the
+    # CLI's exit code is checked, not just the test daemon's
     returncode, stdout, stderr = run_command(
-        f"{PROJECT_ROOT}/minirun delete nonexistent-{os.getpid()}",
-        check=False
+        [MINIRUN, "delete", missing_name],
+        check=False,
+        direct=True
     )
     
     if returncode != 0:
@@ -283,50 +670,89 @@ def test_error_handling():
     else:
         print_error("Non-existent container delete should fail")
     
-    # Try to create duplicate container
-    test_name = f"test-duplicate-{os.getpid()}"
-    run_command(f"{PROJECT_ROOT}/minirun create {test_name}", check=False)
+    # Submit the remaining error cases at once
+    test_name = unique_name("test-duplicate")
+    with container(test_name):
+        info_result, duplicate_result = run_pipelined([
+            [MINIRUN, "info", missing_name],
+            [MINIRUN, "create", test_name],
+        ])
     
-    returncode, stdout, stderr = run_command(
-        f"{PROJECT_ROOT}/minirun create {test_name}",
-        check=False
-    )
+    # Try to show info for non-existent container
+    returncode, stdout, stderr = info_result
+    if returncode != 0:
+        print_success("Non-existent container info properly fails")
+    else:
+        print_error("Non-existent container info should fail")
     
+    # Try to create duplicate container
+    returncode, stdout, stderr = duplicate_result
     if returncode != 0:
         print_success("Duplicate container creation properly fails")
     else:
         print_error("Duplicate container creation should fail")
     
-    # Cleanup
-    run_command(f"{PROJECT_ROOT}/minirun delete {test_name}", check=False)
-    
     return True
 
+def run_buffered(test):
+    """Run a single test with its output captured into a private buffer"""
+    _output.buffer = io.StringIO()
+    try:
+        test()
+    except Exception as e:
+        print_error(f"{test.__name__} raised {type(e).__name__}: {e}")
+    finally:
+        output = _output.buffer.getvalue()
+        del _output.buffer
+    return output
+
 def main():
     """Run all integration tests"""
+    global containers_dirfd
     print("╔════════════════════════════════════════════════╗")
     print("║   MiniRun CLI Integration Tests               ║")
     print("╚════════════════════════════════════════════════╝")
     
-    # Run tests
-    test_cli_exists()
-    test_cli_help()
-    test_container_create()
-    test_container_list()
-    test_container_info()
-    test_container_delete()
-    test_error_handling()
+    tests = [
+        test_cli_exists,
+        test_cli_help,
+        test_container_create,
+        test_container_list,
+        test_container_info,
+        test_container_delete,
+        test_error_handling,
+    ]
+
+    # Create the containers directory up front and keep it open
+    CONTAINERS_DIR.mkdir(exist_ok=True)
+    containers_dirfd = os.open(CONTAINERS_DIR, os.O_DIRECTORY | os.O_RDONLY)
+    daemon = start_daemon()
+    
+    # Run tests concurrently; each one is almost entirely spent waiting on
+    # minirun subprocesses, so threads overlap well
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(run_buffered, test) for test in tests]
+            for future in as_completed(futures):
+                output = future.result()
+                with STATS_LOCK:
+                    sys.stdout.write(output)
+                    sys.stdout.flush()
+    finally:
+        stop_daemon(daemon)
+        os.close(containers_dirfd)
+        containers_dirfd = None
     
     # Summary
     print("\n════════════════════════════════════════════════")
     print("Test Results:")
-    print(f"  Passed: {tests_passed}")
-    print(f"  Failed: {tests_failed}")
+    print(f"  Passed: {STATS.passed}")
+    print(f"  Failed: {STATS.failed}")
     print("════════════════════════════════════════════════")
     
-    if tests_failed > 0:
+    if STATS.failed > 0:
         print("\n❌ Some tests failed:")
-        for test in failed_tests:
+        for test in STATS.failures:
             print(f"  - {test}")
         return 1
     else: